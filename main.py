@@ -1,4 +1,6 @@
+import json
 import pygame
+import random
 import sys
 
 
@@ -24,30 +26,45 @@ class Game(object):
         self.screen_height: int = 600
         self.cell_size: int = 25
         self.panel_size: int = 300
-        self.screen = pygame.display.set_mode((self.screen_width + self.panel_size, 
-                                               self.screen_height - self.cell_size))
-        pygame.display.set_caption('Maze (game)')
 
         self.file_game_settings: str = 'settings.json'
 
-        from json.decoder import JSONDecodeError
-        from json import load
-        
-        # Load game settings from a JSON file
+        # Load game settings from a JSON file and remember them as saved
         try:
             with open(self.file_game_settings, 'r', encoding='UTF-8') as file:
-                self.settings: dict = load(file)
-        except (FileNotFoundError, JSONDecodeError):
+                self.settings: dict = json.load(file)
+            self.saved_settings: dict = dict(self.settings)
+        except (FileNotFoundError, json.JSONDecodeError):
+            self.saved_settings: dict = {}
             # Default settings if the file is not found or corrupted
             self.settings: dict = {
                 'most more best score': 0,
                 'most more completed level': 0,
                 'last best score': 0,
                 'last completed level': 0,
+                'vsync': False,
+                'busy loop': True,
             }
 
+        # Create the window with SDL's scaled renderer; every present uploads
+        # the whole double-buffered frame as a texture, so partial display
+        # updates save nothing. vsync is deliberately off by default rather
+        # than on: the clock (tick or tick_busy_loop) is then the only thing
+        # pacing frames, whereas with vsync each flip would also block until
+        # the display's refresh. Set 'vsync' to true in the settings for
+        # tear-free presentation at the cost of that extra wait
+        self.vsync: bool = self.settings.setdefault('vsync', False)
+        self.screen = pygame.display.set_mode((self.screen_width + self.panel_size, 
+                                               self.screen_height - self.cell_size),
+                                              pygame.SCALED | pygame.DOUBLEBUF, vsync=int(self.vsync))
+        pygame.display.set_caption('Maze (game)')
+
         # Game state variables
         self.fps: int = 60
+        # tick_busy_loop keeps frame times accurate to the millisecond by
+        # spinning instead of sleeping; set 'busy loop' to false in the
+        # settings to sleep between frames and save power instead
+        self.is_busy_loop: bool = self.settings.setdefault('busy loop', True)
         self.running = True
         self.next_number_fruits: int = 3
         self.is_completed_level = False
@@ -71,13 +88,55 @@ class Game(object):
         self.font = pygame.font.Font(None, 25)
         self.font_for_win = pygame.font.SysFont('comicsansms', 60)
 
+        # Pre-render static panel labels and cache text that depends on counters
+        self.text_color: tuple = (250, 250, 250)
+        self._hud_cache: dict = {}
+        self.best_results_text = self.font.render('The Best Results'.title(), True, self.text_color)
+        self.last_best_results_text = self.font.render('Last Results'.title(), True, self.text_color)
+        self.current_now_best_results_text = self.font.render('Current Now Results'.title(), True, self.text_color)
+
+        # Positions of the panel texts, in the order draw_panel renders them
+        self.panel_positions: tuple = (
+            (self.screen_width + 60, 10),
+            (self.screen_width, 10 + self.cell_size),
+            (self.screen_width + 30, 10 + self.cell_size * 2),
+            (self.screen_width + 60, 10 + self.cell_size * 4),
+            (self.screen_width + 60, 10 + self.cell_size * 5),
+            (self.screen_width + 30, 10 + self.cell_size * 6),
+            (self.screen_width + 60, 10 + self.cell_size * 8),
+            (self.screen_width + 30, 10 + self.cell_size * 9),
+            (self.screen_width + 30, 10 + self.cell_size * 10),
+            (self.screen_width + 30, 10 + self.cell_size * 11),
+        )
+
+        # Incremental redraw state
+        self.panel_rect = pygame.Rect(self.screen_width - self.cell_size, 0,
+                                      self.panel_size + self.cell_size,
+                                      self.screen_height - self.cell_size)
+        self.panel_state: tuple = ()
+        self.is_redraw_all = True
+
+        # Background surface shared by all levels, redrawn by generate_maze
+        self.maze_bg = pygame.Surface(self.screen.get_size()).convert()
+
         # Sprite groups for managing game objects
-        self.sprites = pygame.sprite.Group()
-        self.player_obstacles = pygame.sprite.Group()
+        self.sprites = FastGroup()
+        self.maze = bytearray()
+        self.maze_cols: int = 0
+        self.maze_rows: int = 0
         self.player = Player(self.cell_size + self.cell_size // 2, self.cell_size + self.cell_size // 2,
                              self.screen_width, self.screen_height, self.fps, self.cell_size)
         self.sprites.add(self.player)
-        self.fruits = pygame.sprite.Group()
+        # Fruits left on the level and their rects, kept in the same order
+        self.fruits: list = []
+        self.fruit_rects: list = []
+
+        # Fruits bounce once every fruit_animation_period frames, so they are
+        # kept in buckets by the frame of the period on which they move
+        self.fruit_animation_fps: int = self.fps // 2
+        self.fruit_animation_period: int = self.fruit_animation_fps + 1
+        self.fruit_frame: int = 0
+        self.fruit_phases: dict = {}
         self.generate_maze()
 
 
@@ -89,27 +148,27 @@ class Game(object):
         then randomly places fruits in valid positions within the maze.
         It also creates obstacles based on the maze structure.
         """
-        random = __import__('random', fromlist=('shuffle', 'choice', 'randint'))
-
         # Determine maze dimensions
         cols = (self.screen_width // self.cell_size) - 1
         rows = (self.screen_height // self.cell_size) - 1
-        maze = [[1 for _ in range(cols)] for _ in range(rows)]
+        # The maze is a flat grid of bytes indexed as maze[y * cols + x]
+        maze = bytearray(b'\x01') * (rows * cols)
         stack = [(1, 1)]
-        maze[1][1] = 0
+        maze[1 * cols + 1] = 0
+        directions = [(2, 0), (-2, 0), (0, 2), (0, -2)]
 
         # Function to carve passages in the maze
         def carve_passages():
+            shuffle = random.shuffle
             while stack:
                 cx, cy = stack[-1]
-                directions = [(2, 0), (-2, 0), (0, 2), (0, -2)]
-                random.shuffle(directions)
+                shuffle(directions)
                 carved = False
                 for direction in directions:
                     nx, ny = cx + direction[0], cy + direction[1]
-                    if 0 <= nx < cols and 0 <= ny < rows and maze[ny][nx] == 1:
-                        maze[ny][nx] = 0
-                        maze[cy + direction[1] // 2][cx + direction[0] // 2] = 0
+                    if 0 <= nx < cols and 0 <= ny < rows and maze[ny * cols + nx] == 1:
+                        maze[ny * cols + nx] = 0
+                        maze[(cy + direction[1] // 2) * cols + cx + direction[0] // 2] = 0
                         stack.append((nx, ny))
                         carved = True
                         break
@@ -118,38 +177,48 @@ class Game(object):
 
         carve_passages()
 
-        # Generate fruit positions in the maze
+        # Generate fruit positions in the top or bottom (x, y) cell ranges of the maze
+        fruit_areas = (((1, rows - 1), (8, cols - 1)), ((8, rows - 1), (1, cols - 1)))
+        self.fruits = []
+        self.fruit_rects = []
+        self.fruit_frame = 0
+        self.fruit_phases = {}
         number_fruit = self.next_number_fruits
         while number_fruit != 0:
-            fruit_pos = random.choice(['top', 'bottom'])
-            if fruit_pos == 'top':
-                x = random.randint(1, rows - 1)
-                y = random.randint(8, cols - 1)
-            else:
-                x = random.randint(8, rows - 1)
-                y = random.randint(1, cols - 1)
+            x_range, y_range = random.choice(fruit_areas)
+            x = random.randint(*x_range)
+            y = random.randint(*y_range)
 
             # Check if the position is valid
-            if maze[y][x] == 0:
+            if maze[y * cols + x] == 0:
                 x_pos = x * self.cell_size
                 y_pos = y * self.cell_size
                 image = random.choice(self.images_fruits)
                 fruit = GameFruit(image, x_pos + self.cell_size // 4, y_pos + self.cell_size // 5, 
                                   self.cell_size - self.cell_size // 2.5, 
-                                  random.randint(0, 30), self.fps // 2)
-                self.fruits.add(fruit)
+                                  random.randint(0, 30), self.fruit_animation_fps)
+                self.fruits.append(fruit)
+                self.fruit_rects.append(fruit.rect)
                 self.sprites.add(fruit)
+                self.fruit_phases.setdefault(fruit.animation_phase, []).append(fruit)
                 number_fruit -= 1
 
+        # Pre-render the static maze and panel background once per level
+        self.maze_bg.fill((0, 255, 0))
+        pygame.draw.rect(self.maze_bg, (0, 180, 0), self.panel_rect)
+
         # Create obstacles based on the maze structure
         for y in range(rows):
             for x in range(cols):
-                if maze[y][x] == 1:
-                    x_pos = x * self.cell_size
-                    y_pos = y * self.cell_size
-                    obstacle = Wall(x_pos, y_pos, self.cell_size, self.cell_size, (0, 180, 0))
-                    self.sprites.add(obstacle)
-                    self.player_obstacles.add(obstacle)
+                if maze[y * cols + x] == 1:
+                    pygame.draw.rect(self.maze_bg, (0, 180, 0), (x * self.cell_size, y * self.cell_size,
+                                                                 self.cell_size, self.cell_size))
+
+        # Keep the maze grid for collision lookups by cell index
+        self.maze = maze
+        self.maze_cols = cols
+        self.maze_rows = rows
+        self.is_redraw_all = True
 
 
     def run_game(self):
@@ -164,24 +233,25 @@ class Game(object):
             for event in pygame.event.get():
                 if event.type == pygame.QUIT:
                     self.running = False
-                elif event.type == pygame.KEYDOWN:
-                    if self.is_completed_level:
+                elif event.type in (pygame.KEYDOWN, pygame.KEYUP):
+                    if event.type == pygame.KEYDOWN and self.is_completed_level:
                         self.restart_game()
+                    self.player.handle_key(event)
 
             self.draw_game()
             self.update()
 
-        # Save game settings before exiting
-        from json import dump
-        self.settings['most more best score'] = max(self.most_more_best_score, self.settings['most more best score'])
-        self.settings['most more completed level'] = max(self.most_more_completed_level, self.settings['most more completed level'])
+        # Save game settings before exiting, only if they have changed
+        self.settings['most more best score'] = self.most_more_best_score
+        self.settings['most more completed level'] = self.most_more_completed_level
 
         if self.best_score != 0 and self.completed_level != 0:
             self.settings['last best score'] = self.best_score
             self.settings['last completed level'] = self.completed_level
 
-        with open(self.file_game_settings, 'w', encoding='UTF-8') as file:
-            dump(self.settings, file)
+        if self.settings != self.saved_settings:
+            with open(self.file_game_settings, 'w', encoding='UTF-8') as file:
+                json.dump(self.settings, file, separators=(',', ':'))
 
         pygame.quit()
         sys.exit()
@@ -192,42 +262,20 @@ class Game(object):
         Render the current game state on the screen.
 
         This method draws all game objects, the score panel, and
-        displays win messages if the level is completed.
+        displays win messages if the level is completed. Between full
+        redraws only the sprites, and the panel when its counters change,
+        are redrawn over the cached background to save blitting work.
         """
-        self.screen.fill((0, 255, 0))
-        self.sprites.draw(self.screen)
-        pygame.draw.rect(self.screen, (0, 180, 0), (self.screen_width - self.cell_size, 0, 
-                                                    self.panel_size + self.cell_size, 
-                                                    self.screen_height - self.cell_size))
-
-        # Render best results
-        best_results_text = self.font.render('The Best Results'.title(), True, (250, 250, 250))
-        most_more_best_score_text = self.font.render(f'Most More Best Score: {self.most_more_best_score}'.title(), True, (250, 250, 250))
-        most_more_completed_level_text = self.font.render(f'Most More Completed Levels: {self.most_more_completed_level}'.title(), True, (250, 250, 250))
-
-        # Render last results
-        last_best_results_text = self.font.render('Last Results'.title(), True, (250, 250, 250))
-        last_best_score_text = self.font.render(f'Last Best Score: {self.last_best_score}'.title(), True, (250, 250, 250))
-        last_completed_level_text = self.font.render(f'Last Completed Levels: {self.last_completed_level}'.title(), True, (250, 250, 250))
-
-        # Render current results
-        current_now_best_results_text = self.font.render('Current Now Results'.title(), True, (250, 250, 250))
-        current_now_score_text = self.font.render(f'Score: {self.score}'.title(), True, (250, 250, 250))
-        current_now_best_score_text = self.font.render(f'Best Score: {self.best_score}'.title(), True, (250, 250, 250))
-        current_now_completed_level_text = self.font.render(f'Completed Levels: {self.completed_level}'.title(), True, (250, 250, 250))
-
-        # Blit the rendered text onto the screen
-        self.screen.blit(best_results_text, (self.screen_width + 60, 10))
-        self.screen.blit(most_more_completed_level_text, (self.screen_width, 10 + self.cell_size))
-        self.screen.blit(most_more_best_score_text, (self.screen_width + 30, 10 + self.cell_size * 2))
-        self.screen.blit(last_best_results_text, (self.screen_width + 60, 10 + self.cell_size * 4))
-        self.screen.blit(last_completed_level_text, (self.screen_width + 60, 10 + self.cell_size * 5))
-        self.screen.blit(last_best_score_text, (self.screen_width + 30, 10 + self.cell_size * 6))
-
-        self.screen.blit(current_now_best_results_text, (self.screen_width + 60, 10 + self.cell_size * 8))
-        self.screen.blit(current_now_score_text, (self.screen_width + 30, 10 + self.cell_size * 9))
-        self.screen.blit(current_now_best_score_text, (self.screen_width + 30, 10 + self.cell_size * 10))
-        self.screen.blit(current_now_completed_level_text, (self.screen_width + 30, 10 + self.cell_size * 11))
+        if self.is_redraw_all or self.is_completed_level:
+            self.screen.blit(self.maze_bg, (0, 0))
+            self.sprites.draw(self.screen)
+            self.draw_panel()
+            self.is_redraw_all = False
+        else:
+            self.sprites.clear(self.screen, self.maze_bg)
+            self.sprites.draw(self.screen)
+            if self.panel_state != self.get_panel_state():
+                self.draw_panel()
 
         # Display win message if the level is completed
         if self.is_completed_level:
@@ -238,6 +286,116 @@ class Game(object):
             self.screen.blit(winner_text, (self.screen_width // 2 - self.cell_size * 5, 
                                            self.screen_height // 2 - self.cell_size * 3))
 
+
+    def get_panel_state(self):
+        """
+        Return the counters shown on the score panel.
+        """
+        return (self.most_more_best_score, self.most_more_completed_level,
+                self.last_best_score, self.last_completed_level,
+                self.score, self.best_score, self.completed_level)
+
+
+    def draw_panel(self):
+        """
+        Draw the score panel over its part of the background.
+
+        This method remembers the counters it has drawn so that the
+        panel is only redrawn once one of them changes.
+        """
+        self.screen.blit(self.maze_bg, self.panel_rect, self.panel_rect)
+        self.panel_state = self.get_panel_state()
+
+        # Render best results
+        best_results_text = self.best_results_text
+        most_more_best_score_text = self._text('most more best score', 'Most More Best Score: {}', self.most_more_best_score)
+        most_more_completed_level_text = self._text('most more completed level', 'Most More Completed Levels: {}', self.most_more_completed_level)
+
+        # Render last results
+        last_best_results_text = self.last_best_results_text
+        last_best_score_text = self._text('last best score', 'Last Best Score: {}', self.last_best_score)
+        last_completed_level_text = self._text('last completed level', 'Last Completed Levels: {}', self.last_completed_level)
+
+        # Render current results
+        current_now_best_results_text = self.current_now_best_results_text
+        current_now_score_text = self._text('score', 'Score: {}', self.score)
+        current_now_best_score_text = self._text('best score', 'Best Score: {}', self.best_score)
+        current_now_completed_level_text = self._text('completed level', 'Completed Levels: {}', self.completed_level)
+
+        # Blit the rendered text onto the screen in one batch
+        texts = (best_results_text, most_more_completed_level_text, most_more_best_score_text,
+                 last_best_results_text, last_completed_level_text, last_best_score_text,
+                 current_now_best_results_text, current_now_score_text,
+                 current_now_best_score_text, current_now_completed_level_text)
+        self.screen.blits(tuple(zip(texts, self.panel_positions)), doreturn=False)
+
+
+    def _text(self, key, template, value):
+        """
+        Return the rendered panel text for a counter.
+
+        The text surface is cached under the given key and rendered
+        again only when the counter value has changed.
+        """
+        cached = self._hud_cache.get(key)
+        if cached is None or cached[0] != value:
+            cached = (value, self.font.render(template.format(value).title(), True, self.text_color))
+            self._hud_cache[key] = cached
+        return cached[1]
+
+
+    def wall_collisions(self):
+        """
+        Return the rects of the walls the player is touching.
+
+        Walls are aligned to the maze grid, so only the cells under
+        the player's rect are looked up instead of scanning every wall.
+        """
+        rect = self.player.rect
+        x0, y0 = max(rect.left // self.cell_size, 0), max(rect.top // self.cell_size, 0)
+        x1 = min((rect.right - 1) // self.cell_size, self.maze_cols - 1)
+        y1 = min((rect.bottom - 1) // self.cell_size, self.maze_rows - 1)
+        return [
+            pygame.Rect(x * self.cell_size, y * self.cell_size, self.cell_size, self.cell_size)
+            for y in range(y0, y1 + 1) for x in range(x0, x1 + 1)
+            if self.maze[y * self.maze_cols + x]
+        ]
+
+
+    def resolve_wall_collisions(self, wall_rects):
+        """
+        Push the player out of the given walls.
+
+        This method moves the player back to the side of every wall it
+        overlaps, preferring the axis the player is not moving along.
+        """
+        player_rect = self.player.rect
+        is_move_y = self.player.is_move_y
+        for obstacle_rect in wall_rects:
+            # Handle collisions with obstacles
+            right, left = player_rect.right, player_rect.left
+            top, bottom = player_rect.top, player_rect.bottom
+            center_x, center_y = obstacle_rect.centerx, obstacle_rect.centery
+            if is_move_y:
+                if right < center_x:
+                    player_rect.right = obstacle_rect.left
+                elif left > center_x:
+                    player_rect.left = obstacle_rect.right
+                elif top > center_y:
+                    player_rect.top = obstacle_rect.bottom
+                elif bottom < center_y:
+                    player_rect.bottom = obstacle_rect.top
+            else:
+                if top > center_y:
+                    player_rect.top = obstacle_rect.bottom
+                elif bottom < center_y:
+                    player_rect.bottom = obstacle_rect.top
+                elif right < center_x:
+                    player_rect.right = obstacle_rect.left
+                elif left > center_x:
+                    player_rect.left = obstacle_rect.right
+
+
     def update(self):
         """
         Update the game state.
@@ -248,46 +406,37 @@ class Game(object):
         # Update player movements and check collisions
         self.player.player_moves()
 
-        for obstacle_player in pygame.sprite.spritecollide(self.player, self.player_obstacles, False):
-            # Handle collisions with obstacles
-            if self.player.is_move_y:
-                if self.player.rect.right < obstacle_player.rect.centerx:
-                    self.player.rect.right = obstacle_player.rect.left
-                elif self.player.rect.left > obstacle_player.rect.centerx:
-                    self.player.rect.left = obstacle_player.rect.right
-                elif self.player.rect.top > obstacle_player.rect.centery:
-                    self.player.rect.top = obstacle_player.rect.bottom
-                elif self.player.rect.bottom < obstacle_player.rect.centery:
-                    self.player.rect.bottom = obstacle_player.rect.top
-            else:
-                if self.player.rect.top > obstacle_player.rect.centery:
-                    self.player.rect.top = obstacle_player.rect.bottom
-                elif self.player.rect.bottom < obstacle_player.rect.centery:
-                    self.player.rect.bottom = obstacle_player.rect.top
-                elif self.player.rect.right < obstacle_player.rect.centerx:
-                    self.player.rect.right = obstacle_player.rect.left
-                elif self.player.rect.left > obstacle_player.rect.centerx:
-                    self.player.rect.left = obstacle_player.rect.right
+        self.resolve_wall_collisions(self.wall_collisions())
 
         # Check for collisions with fruits
-        for _ in pygame.sprite.spritecollide(self.player, self.fruits, True):
+        for index in reversed(self.player.rect.collidelistall(self.fruit_rects)):
+            fruit = self.fruits.pop(index)
+            fruit.kill()
+            self.fruit_rects.pop(index)
+            self.fruit_phases[fruit.animation_phase].remove(fruit)
             self.score += 1
             if self.score > self.best_score:
                 self.best_score = self.score
                 if self.best_score > self.most_more_best_score:
                     self.most_more_best_score = self.best_score
 
-        # Animate fruits
-        for fruit in self.fruits:
+        # Animate only the fruits that bounce on this frame
+        for fruit in self.fruit_phases.get(self.fruit_frame, ()):
             fruit.animation()
+        self.fruit_frame = (self.fruit_frame + 1) % self.fruit_animation_period
 
         # Check if level is completed
-        if not self.fruits.sprites():
+        if not self.fruits:
             self.is_completed_level = True
 
-        # Control the frame rate
-        self.clock.tick(self.fps)
-        pygame.display.update()
+        # Control the frame rate and present the frame; the SCALED window
+        # always uploads the whole frame, so there is nothing to gain from
+        # updating only parts of the display
+        if self.is_busy_loop:
+            self.clock.tick_busy_loop(self.fps)
+        else:
+            self.clock.tick(self.fps)
+        pygame.display.flip()
 
 
     def restart_game(self):
@@ -295,7 +444,8 @@ class Game(object):
         Restart the game.
 
         This method resets the game state, including score, completion status,
-        and player position. It also generates a new maze and starts the game loop.
+        and player position. It also generates a new maze; the running game
+        loop in run_game carries on with the new level.
         """
         # Reset game state for restarting
         self.score = 0
@@ -303,32 +453,92 @@ class Game(object):
         self.player.rect.topleft = (self.cell_size + self.cell_size // 2, self.cell_size + self.cell_size // 2)
         self.next_number_fruits += 1
         self.sprites.empty()
-        self.player_obstacles.empty()
         self.generate_maze()
+
+        # Keep the arrow keys still held down moving the new player
+        pressed_keys, vx, vy = self.player.pressed_keys, self.player.vx, self.player.vy
         self.player = Player(self.cell_size + self.cell_size // 2, self.cell_size + self.cell_size // 2,
                              self.screen_width, self.screen_height, self.fps, self.cell_size)
+        self.player.pressed_keys, self.player.vx, self.player.vy = pressed_keys, vx, vy
         self.sprites.add(self.player)
         self.completed_level += 1
-        self.run_game()
+        if self.completed_level > self.most_more_completed_level:
+            self.most_more_completed_level = self.completed_level
 
 
-class Wall(pygame.sprite.Sprite):
+class FastGroup(pygame.sprite.Group):
     """
-    The Wall class represents a wall or obstacle in the game.
+    The FastGroup class is a sprite group optimized for drawing.
 
-    It serves as a specific type of game object that blocks the player's movement.
+    It keeps its sprites in a list alongside the usual dictionary,
+    draws them all with a single batched blit call per frame and
+    remembers where they were drawn so that clear can erase them.
     """
-    
-    def __init__(self, x, y, width, height, color):
+
+    def __init__(self, *sprites):
         """
-        Initialize a wall object.
+        Initialize a fast sprite group.
 
-        This method creates a wall with the specified dimensions and color.
+        This method prepares the list of sprites used for drawing
+        and adds any given sprites to the group.
         """
-        super().__init__()
-        self.image = pygame.Surface((width, height))
-        self.image.fill(color)
-        self.rect = self.image.get_rect(topleft=(x, y))
+        self.sprites_list: list = []
+        super().__init__(*sprites)
+
+
+    def add_internal(self, sprite, layer=None):
+        """
+        Add a sprite to the group and to the drawing list.
+        """
+        if sprite not in self.spritedict:
+            self.sprites_list.append(sprite)
+        super().add_internal(sprite, layer)
+
+
+    def remove_internal(self, sprite):
+        """
+        Remove a sprite from the group and from the drawing list.
+        """
+        super().remove_internal(sprite)
+        self.sprites_list.remove(sprite)
+
+
+    def sprites(self):
+        """
+        Return a copy of the sprites in the order they were added.
+        """
+        return self.sprites_list[:]
+
+
+    def empty(self):
+        """
+        Remove all sprites from the group at once.
+        """
+        for sprite in self.sprites_list:
+            sprite.remove_internal(self)
+        self.lostsprites.extend(rect for rect in self.spritedict.values() if rect)
+        self.spritedict.clear()
+        self.sprites_list.clear()
+
+
+    def draw(self, surface, special_flags=0):
+        """
+        Draw all sprites onto the surface with one batched blit.
+
+        This method uses fblits when it is available (pygame-ce)
+        and falls back to blits otherwise. The drawn rects are stored
+        for the next call to clear.
+        """
+        if hasattr(surface, 'fblits'):
+            surface.fblits([(sprite.image, sprite.rect) for sprite in self.sprites_list], special_flags)
+        else:
+            surface.blits([(sprite.image, sprite.rect, None, special_flags) for sprite in self.sprites_list],
+                          doreturn=False)
+
+        for sprite in self.sprites_list:
+            self.spritedict[sprite] = sprite.rect.copy()
+        self.lostsprites = []
+        return self.lostsprites
 
 
 class GameFruit(pygame.sprite.Sprite):
@@ -338,6 +548,9 @@ class GameFruit(pygame.sprite.Sprite):
     It extends the Sprite class to include properties for animation,
     such as vertical movement to create a bouncing effect.
     """
+
+    # Scaled fruit images shared between instances, keyed by (image, cell_size)
+    _image_cache: dict = {}
     
     def __init__(self, image, x, y, cell_size, animation_wait, fps):
         """
@@ -347,18 +560,21 @@ class GameFruit(pygame.sprite.Sprite):
         size, animation delay, and frames per second for animation behavior.
         """
         super().__init__()
-        self.image = pygame.image.load(f'assets/Graphics/fruits/{image}.png')
-
-        self.image = pygame.transform.scale(
-            self.image,
-            (cell_size, cell_size)
-        )
+        key = (image, cell_size)
+        if key not in GameFruit._image_cache:
+            GameFruit._image_cache[key] = pygame.transform.scale(
+                pygame.image.load(f'assets/Graphics/fruits/{image}.png').convert_alpha(),
+                (cell_size, cell_size)
+            )
+        self.image = GameFruit._image_cache[key]
 
         self.rect = self.image.get_rect(topleft=(x, y))
 
-        self.animation_wait = animation_wait
+        # The fruit bounces every fps + 1 frames, the first time after
+        # fps - animation_wait frames; animation_phase is that frame
+        # within the period, counted from the start of the level
         self.animation_state = True
-        self.fps = fps
+        self.animation_phase: int = (fps - animation_wait) % (fps + 1)
         self.speed: int = 5
 
 
@@ -368,16 +584,13 @@ class GameFruit(pygame.sprite.Sprite):
 
         This method changes the position of the fruit to create an
         up-and-down bouncing effect based on the animation state.
+        It is called by the game on the frames of the fruit's phase.
         """
-        if self.animation_wait >= self.fps:
-            self.animation_wait = 0
-            if self.animation_state:
-                self.rect.y += self.speed
-            else:
-                self.rect.y -= self.speed
-            self.animation_state = not self.animation_state
+        if self.animation_state:
+            self.rect.y += self.speed
         else:
-            self.animation_wait += 1
+            self.rect.y -= self.speed
+        self.animation_state = not self.animation_state
 
 
 class Player(pygame.sprite.Sprite):
@@ -387,6 +600,9 @@ class Player(pygame.sprite.Sprite):
     It handles player input for movement, manages player animation,
     and keeps track of the player's position within the game world.
     """
+
+    # Scaled animation images shared between instances, keyed by cell_size
+    _images_cache: dict = {}
     
     def __init__(self, x, y, screen_width, screen_height, fps, cell_size, speed=5):
         """
@@ -397,25 +613,39 @@ class Player(pygame.sprite.Sprite):
         handling player input.
         """
         super().__init__()
-        # Load and scale player images for animation
-        self.images = [
-            pygame.transform.scale(
-            pygame.image.load(f'assets/Graphics/player_animation/player_image_{i}.png'), 
-            (cell_size, cell_size)) for i in range(4)
-        ]
+        # Load and scale player images for animation once per cell size
+        if cell_size not in Player._images_cache:
+            images = [
+                pygame.transform.scale(
+                pygame.image.load(f'assets/Graphics/player_animation/player_image_{i}.png').convert(), 
+                (cell_size, cell_size)) for i in range(4)
+            ]
 
-        for image in self.images: image.set_colorkey((255, 255, 255))
+            for image in images: image.set_colorkey((255, 255, 255))
+            Player._images_cache[cell_size] = images
+
+        self.images = Player._images_cache[cell_size]
 
         self.image = self.images[0]
         self.rect = self.image.get_rect(center=(x, y))
         self.speed = speed
-        self.screen_width = screen_width
-        self.screen_height = screen_height
+        self.world_bounds = pygame.Rect(0, 0, screen_width, screen_height)
         self.fps = fps
         self.wait: int = 0
         self.index_image: int = 0
         self.is_move_y = bool
 
+        # Velocity set from the arrow keys currently held down, in order of priority
+        self.vx: int = 0
+        self.vy: int = 0
+        self.pressed_keys: set = set()
+        self.key_directions: dict = {
+            pygame.K_RIGHT: (speed, 0),
+            pygame.K_LEFT: (-speed, 0),
+            pygame.K_UP: (0, -speed),
+            pygame.K_DOWN: (0, speed),
+        }
+
 
     def animation(self):
         """
@@ -432,27 +662,40 @@ class Player(pygame.sprite.Sprite):
             self.wait += 1
 
 
+    def handle_key(self, event):
+        """
+        Update the player's velocity from a keyboard event.
+
+        This method tracks which arrow keys are held down and moves the
+        player in the direction of the first one held, checking right,
+        left, up and down in that order.
+        """
+        if event.key not in self.key_directions:
+            return
+        if event.type == pygame.KEYDOWN:
+            self.pressed_keys.add(event.key)
+        else:
+            self.pressed_keys.discard(event.key)
+
+        self.vx, self.vy = 0, 0
+        for key, direction in self.key_directions.items():
+            if key in self.pressed_keys:
+                self.vx, self.vy = direction
+                break
+
+
     def player_moves(self):
         """
-        Handle player movement based on keyboard input.
+        Move the player by its current velocity.
 
-        This method checks for keyboard events to move the player
-        character in the specified direction and manages the animation state.
+        This method moves the player character in the direction set by
+        handle_key, keeps it within the screen and manages the animation state.
         """
         self.animation()
-        key = pygame.key.get_pressed()
-        if key[pygame.K_RIGHT] and self.rect.right < self.screen_width:
-            self.rect.x += self.speed
-            self.is_move_y = False
-        elif key[pygame.K_LEFT] and self.rect.left > 0:
-            self.rect.x -= self.speed
-            self.is_move_y = False
-        elif key[pygame.K_UP] and self.rect.top > 0:
-            self.rect.y -= self.speed
-            self.is_move_y = True
-        elif key[pygame.K_DOWN] and self.rect.bottom < self.screen_height:
-            self.rect.y += self.speed
-            self.is_move_y = True
+        if self.vx or self.vy:
+            self.rect.move_ip(self.vx, self.vy)
+            self.rect.clamp_ip(self.world_bounds)
+            self.is_move_y = self.vy != 0
 
 
 if __name__ == '__main__':